@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-16 09:12
+
+import core.models.base
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("jobs", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="jobexecutionlog",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.base.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="scheduledjob",
+            name="id",
+            field=models.UUIDField(
+                default=core.models.base.uuid7,
+                editable=False,
+                primary_key=True,
+                serialize=False,
+            ),
+        ),
+    ]
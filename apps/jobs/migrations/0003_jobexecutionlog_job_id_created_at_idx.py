@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-16 09:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("jobs", "0002_alter_ids_uuid7"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="jobexecutionlog",
+            index=models.Index(
+                fields=["job_id", "created_at"], name="job_executi_job_id_074610_idx"
+            ),
+        ),
+    ]
@@ -29,6 +29,7 @@ class JobExecutionLog(BaseModel):
         indexes = [
             models.Index(fields=["job_id", "status"]),
             models.Index(fields=["status", "created_at"]),
+            models.Index(fields=["job_id", "created_at"]),
         ]
 
     def __str__(self):
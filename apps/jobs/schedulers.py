@@ -1,8 +1,10 @@
 import logging
-from typing import Any, Callable, Dict
+from typing import Any, Callable, Dict, List, Union
 
 from apscheduler.executors.pool import ThreadPoolExecutor
+from apscheduler.jobstores.base import JobLookupError
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import STATE_RUNNING
 from django.conf import settings
 from django_apscheduler.jobstores import DjangoJobStore
 
@@ -57,8 +59,12 @@ class JobSchedulerService:
             logger.info("Job scheduler shutdown")
 
     @classmethod
-    def add_job(cls, func: Callable, trigger: str, job_id: str, **kwargs):
-        """Add a job to the scheduler."""
+    def add_job(cls, func: Union[Callable, str], trigger: str, job_id: str, **kwargs):
+        """Add a job to the scheduler.
+
+        ``func`` may be a callable or a ``"module:function"`` reference; use a
+        reference (or a module-level function) with persistent job stores.
+        """
         scheduler = cls.get_scheduler()
         try:
             scheduler.add_job(
@@ -70,14 +76,42 @@ class JobSchedulerService:
             raise
 
     @classmethod
-    def remove_job(cls, job_id: str):
-        """Remove a job from the scheduler."""
+    def add_jobs_bulk(cls, jobs: List[Dict[str, Any]]):
+        """Add several jobs with a single scheduler wakeup.
+
+        Each item holds the ``add_job`` arguments (``func``, ``trigger``,
+        ``job_id`` and trigger options). The scheduler is paused while the
+        jobs are added so it re-reads the job store once, on resume, instead
+        of after every addition.
+        """
+        scheduler = cls.get_scheduler()
+        was_running = scheduler.state == STATE_RUNNING
+        if was_running:
+            scheduler.pause()
+        try:
+            for job in jobs:
+                cls.add_job(**job)
+        finally:
+            if was_running:
+                scheduler.resume()
+
+    @classmethod
+    def remove_job(cls, job_id: str) -> bool:
+        """Remove a job from the scheduler.
+
+        Returns ``False`` when the job does not exist.
+        """
         scheduler = cls.get_scheduler()
         try:
             scheduler.remove_job(job_id)
-            logger.info(f"Job {job_id} removed successfully")
+        except JobLookupError:
+            logger.debug(f"Job {job_id} not found, nothing to remove")
+            return False
         except Exception as e:
             logger.error(f"Error removing job {job_id}: {str(e)}")
+            raise
+        logger.info(f"Job {job_id} removed successfully")
+        return True
 
     @classmethod
     def list_jobs(cls):
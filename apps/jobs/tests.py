@@ -1,3 +1,209 @@
-from django.test import TestCase
+import logging
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from unittest import mock
 
-# Create your tests here.
+from apscheduler.schedulers.background import BackgroundScheduler
+from django.db.models.signals import post_save
+from django.test import SimpleTestCase, TestCase, TransactionTestCase
+
+from apps.jobs.models import JobExecutionLog
+from apps.jobs.schedulers import JobSchedulerService
+from core.models.base import BaseRepository
+from core.utils.logging import DatabaseLogHandler
+
+
+class BaseRepositoryTest(TestCase):
+    """Tests for BaseRepository using JobExecutionLog as the model."""
+
+    def setUp(self):
+        self.repository = BaseRepository(JobExecutionLog)
+        self.log = JobExecutionLog.objects.create(job_id="job-1", job_name="Job 1")
+
+    def test_get_fields_returns_requested_fields(self):
+        self.assertEqual(
+            self.repository.get_fields(self.log.id, "job_id", "job_name"),
+            {"job_id": "job-1", "job_name": "Job 1"},
+        )
+
+    def test_get_fields_ignores_inactive_objects(self):
+        JobExecutionLog.objects.filter(id=self.log.id).update(is_active=False)
+
+        self.assertIsNone(self.repository.get_fields(self.log.id, "job_id"))
+
+    def test_update_uses_single_update_query(self):
+        """update() issues one UPDATE plus the refetch, without save()."""
+        received = []
+
+        def receiver(**kwargs):
+            received.append(kwargs)
+
+        post_save.connect(receiver, sender=JobExecutionLog)
+        self.addCleanup(post_save.disconnect, receiver, sender=JobExecutionLog)
+
+        with self.assertNumQueries(2):
+            updated = self.repository.update(self.log.id, status="SUCCESS")
+
+        self.assertEqual(updated.status, "SUCCESS")
+        self.assertGreater(updated.updated_at, self.log.updated_at)
+        self.assertEqual(received, [])
+
+    def test_update_returns_none_for_missing_object(self):
+        JobExecutionLog.objects.filter(id=self.log.id).update(is_active=False)
+
+        self.assertIsNone(self.repository.update(self.log.id, status="SUCCESS"))
+
+    def test_soft_delete_returns_bool_without_signals(self):
+        received = []
+
+        def receiver(**kwargs):
+            received.append(kwargs)
+
+        post_save.connect(receiver, sender=JobExecutionLog)
+        self.addCleanup(post_save.disconnect, receiver, sender=JobExecutionLog)
+
+        with self.assertNumQueries(1):
+            self.assertTrue(self.repository.soft_delete(self.log.id))
+
+        self.assertFalse(self.repository.soft_delete(self.log.id))
+        self.assertFalse(self.repository.exists(self.log.id))
+        self.assertEqual(received, [])
+
+
+class DatabaseLogHandlerTest(TransactionTestCase):
+    """Tests for the batching database log handler.
+
+    The flusher thread writes through its own connection, so these tests
+    need committed data rather than TestCase's wrapping transaction.
+    """
+
+    def setUp(self):
+        self.handler = DatabaseLogHandler()
+        self.logger = logging.getLogger("tests.database_log_handler")
+        self.logger.propagate = False
+        self.logger.setLevel(logging.INFO)
+        self.logger.addHandler(self.handler)
+
+    def tearDown(self):
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+    def test_persists_record_contents(self):
+        """Records with a job_id are stored with their plain message."""
+        self.logger.info("started", extra={"job_id": "job-1", "job_name": "Job 1"})
+        try:
+            raise ValueError("bad input")
+        except ValueError:
+            self.logger.exception(
+                "boom %d", 5, extra={"job_id": "job-1", "status": "FAILED"}
+            )
+        self.handler.close()
+
+        info = JobExecutionLog.objects.get(job_id="job-1", status="RUNNING")
+        error = JobExecutionLog.objects.get(job_id="job-1", status="FAILED")
+        self.assertEqual(info.job_name, "Job 1")
+        self.assertIsNone(info.error_message)
+        self.assertEqual(info.metadata["level"], "INFO")
+        self.assertEqual(info.metadata["funcName"], "test_persists_record_contents")
+        self.assertEqual(error.error_message, "boom 5")
+
+    def test_ignores_formatter_output(self):
+        """The stored message is not the formatter's output."""
+        self.handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        self.logger.error("failed", extra={"job_id": "job-2"})
+        self.handler.close()
+
+        log = JobExecutionLog.objects.get(job_id="job-2")
+        self.assertEqual(log.error_message, "failed")
+
+    def test_ignores_records_without_job_id(self):
+        """Records that carry no job_id are not queued."""
+        self.logger.info("unrelated")
+        self.assertTrue(self.handler.queue.empty())
+        self.handler.close()
+
+        self.assertFalse(JobExecutionLog.objects.exists())
+
+    def test_drops_records_when_queue_is_full(self):
+        """A full queue drops records and counts them instead of blocking."""
+
+        class SmallQueueHandler(DatabaseLogHandler):
+            queue_size = 2
+
+        handler = SmallQueueHandler()
+        # Stop the flusher so queued records stay in the queue
+        handler._stop_event.set()
+        handler._flusher.join()
+
+        record = self.logger.makeRecord(
+            self.logger.name, logging.INFO, __file__, 0, "msg", None, None
+        )
+        record.job_id = "job-3"
+        for _ in range(3):
+            handler.handle(record)
+
+        self.assertEqual(handler.dropped_records, 1)
+        handler.close()
+        self.assertEqual(JobExecutionLog.objects.filter(job_id="job-3").count(), 2)
+
+    def test_close_flushes_pending_records(self):
+        """close() writes records still waiting in the queue."""
+        self.handler._stop_event.set()
+        self.handler._flusher.join()
+        for i in range(5):
+            self.logger.info("step %d", i, extra={"job_id": "job-4"})
+        self.assertEqual(self.handler.queue.qsize(), 5)
+
+        self.handler.close()
+
+        self.assertEqual(JobExecutionLog.objects.filter(job_id="job-4").count(), 5)
+        self.assertTrue(self.handler.queue.empty())
+
+    def test_uses_record_time_as_created_at(self):
+        """Each row keeps the time its record was emitted, not the flush time."""
+        self.handler._stop_event.set()
+        self.handler._flusher.join()
+        timestamps = [1_700_000_000.25, 1_700_000_005.5]
+        for created in timestamps:
+            record = self.logger.makeRecord(
+                self.logger.name, logging.INFO, __file__, 0, "msg", None, None
+            )
+            record.job_id = "job-5"
+            record.created = created
+            self.handler.handle(record)
+
+        self.handler.close()
+
+        self.assertEqual(
+            list(
+                JobExecutionLog.objects.filter(job_id="job-5")
+                .order_by("created_at")
+                .values_list("created_at", flat=True)
+            ),
+            [datetime.fromtimestamp(t, tz=dt_timezone.utc) for t in timestamps],
+        )
+
+
+class JobSchedulerServiceTest(SimpleTestCase):
+    """Tests for JobSchedulerService on an in-memory scheduler."""
+
+    def setUp(self):
+        self.scheduler = BackgroundScheduler()
+        original = JobSchedulerService._scheduler
+        JobSchedulerService._scheduler = self.scheduler
+        self.addCleanup(setattr, JobSchedulerService, "_scheduler", original)
+
+    def test_remove_job_reports_whether_job_existed(self):
+        JobSchedulerService.add_job(print, "interval", "job-1", minutes=5)
+
+        self.assertTrue(JobSchedulerService.remove_job("job-1"))
+        self.assertIsNone(JobSchedulerService.get_job("job-1"))
+        self.assertFalse(JobSchedulerService.remove_job("job-1"))
+
+    def test_remove_job_reraises_unexpected_errors(self):
+        with mock.patch.object(
+            self.scheduler, "remove_job", side_effect=RuntimeError("store down")
+        ):
+            with self.assertLogs("apps.jobs.schedulers", "ERROR"):
+                with self.assertRaises(RuntimeError):
+                    JobSchedulerService.remove_job("job-1")
@@ -3,11 +3,35 @@ from abc import ABC, abstractmethod
 from typing import Any, Dict, Optional
 
 from django.conf import settings
+from langchain_core.caches import InMemoryCache
+from langchain_core.globals import set_llm_cache
 from langchain_core.runnables import Runnable
 from langchain_openai import ChatOpenAI
 
 logger = logging.getLogger(__name__)
 
+_llm_cache_configured = False
+
+
+def configure_llm_cache():
+    """Install the global LLM response cache configured in settings (once)."""
+    global _llm_cache_configured
+    if _llm_cache_configured:
+        return
+
+    backend = settings.LANGCHAIN_CONFIG.get("LLM_CACHE", "none")
+    if backend == "memory":
+        set_llm_cache(
+            InMemoryCache(maxsize=settings.LANGCHAIN_CONFIG["LLM_CACHE_MAXSIZE"])
+        )
+    elif backend == "sqlite":
+        from langchain_community.cache import SQLiteCache
+
+        set_llm_cache(
+            SQLiteCache(database_path=settings.LANGCHAIN_CONFIG["LLM_CACHE_PATH"])
+        )
+    _llm_cache_configured = True
+
 
 class BaseLangChainService(ABC):
     """Base service class for LangChain operations."""
@@ -19,6 +43,7 @@ class BaseLangChainService(ABC):
         self.temperature = (
             temperature or settings.LANGCHAIN_CONFIG["DEFAULT_TEMPERATURE"]
         )
+        configure_llm_cache()
         self.llm = self._initialize_llm()
 
     def _initialize_llm(self) -> ChatOpenAI:
@@ -33,23 +33,52 @@ class TextProcessorService(BaseLangChainService):
             chain = self.build_chain()
             result = chain.invoke(input_data)
 
-            return {
-                "success": True,
-                "result": result,
-                "input": input_data,
-                "model_used": self.model_name,
-                "template_used": self.template,
-            }
+            return self._build_result(result, input_data)
         except Exception as e:
             return self._handle_error(e, input_data)
 
-    def batch_process(self, inputs: list[Dict[str, Any]]) -> list[Dict[str, Any]]:
-        """Process multiple texts in batch."""
-        results = []
-        for input_data in inputs:
-            result = self.process(input_data)
-            results.append(result)
-        return results
+    def batch_process(
+        self, inputs: list[Dict[str, Any]], max_concurrency: int = 5
+    ) -> list[Dict[str, Any]]:
+        """Process multiple texts in batch.
+
+        The chain is built once and the inputs are sent concurrently through
+        ``Runnable.batch``; a failing input only affects its own result.
+        """
+        if not inputs:
+            return []
+
+        try:
+            logger.info(
+                f"Processing {len(inputs)} texts with template: {self.template}"
+            )
+            chain = self.build_chain()
+            outputs = chain.batch(
+                inputs,
+                config={"max_concurrency": max_concurrency},
+                return_exceptions=True,
+            )
+        except Exception as e:
+            return [self._handle_error(e, input_data) for input_data in inputs]
+
+        return [
+            (
+                self._handle_error(output, input_data)
+                if isinstance(output, Exception)
+                else self._build_result(output, input_data)
+            )
+            for input_data, output in zip(inputs, outputs)
+        ]
+
+    def _build_result(self, result: str, input_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the success payload for a processed input."""
+        return {
+            "success": True,
+            "result": result,
+            "input": input_data,
+            "model_used": self.model_name,
+            "template_used": self.template,
+        }
 
 
 class TextSummarizerService(BaseLangChainService):
@@ -177,6 +177,14 @@ LANGCHAIN_CONFIG = {
     "DEFAULT_MODEL": "gpt-4-turbo-preview",
     "MAX_TOKENS": 4096,
     "TIMEOUT": 30,
+    # LLM response cache: "memory", "sqlite" or "none"
+    "LLM_CACHE": get_env_variable("LANGCHAIN_LLM_CACHE", "memory"),
+    # SQLite file used by the "sqlite" backend
+    "LLM_CACHE_PATH": get_env_variable(
+        "LANGCHAIN_LLM_CACHE_PATH", str(BASE_DIR / ".langchain.db")
+    ),
+    # Maximum number of responses kept by the "memory" backend
+    "LLM_CACHE_MAXSIZE": int(get_env_variable("LANGCHAIN_LLM_CACHE_MAXSIZE", "1000")),
 }
 
 # Logging
@@ -8,14 +8,20 @@ ALLOWED_HOSTS = [
 ]
 
 # Database for production (PostgreSQL)
+DATABASE_USER = get_env_variable("DATABASE_USER")
+DATABASE_PASSWORD = get_env_variable("DATABASE_PASSWORD")
+DATABASE_HOST = get_env_variable("DATABASE_HOST")
+DATABASE_PORT = get_env_variable("DATABASE_PORT")
+DATABASE_NAME = get_env_variable("DATABASE_NAME")
+
 DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.postgresql",
-        "NAME": get_env_variable("DATABASE_NAME"),
-        "USER": get_env_variable("DATABASE_USER"),
-        "PASSWORD": get_env_variable("DATABASE_PASSWORD"),
-        "HOST": get_env_variable("DATABASE_HOST"),
-        "PORT": get_env_variable("DATABASE_PORT"),
+        "NAME": DATABASE_NAME,
+        "USER": DATABASE_USER,
+        "PASSWORD": DATABASE_PASSWORD,
+        "HOST": DATABASE_HOST,
+        "PORT": DATABASE_PORT,
     }
 }
 
@@ -23,24 +29,30 @@ DATABASES = {
 if get_env_variable("DATABASE_URL", None):
     DATABASES["default"] = dj_database_url.parse(get_env_variable("DATABASE_URL"))
 
+# psycopg 3 connection pool (Django 5.1+); requires CONN_MAX_AGE = 0
+DATABASES["default"].setdefault("OPTIONS", {})["pool"] = True
+DATABASES["default"]["CONN_MAX_AGE"] = 0
+
 # Static files
 STATIC_ROOT = BASE_DIR / "staticfiles"
 STATICFILES_STORAGE = "whitenoise.storage.CompressedManifestStaticFilesStorage"
 
 # APScheduler for production (PostgreSQL)
+# Note: JobSchedulerService uses DjangoJobStore, which goes through Django's
+# (pooled) "default" connection above; SCHEDULER_CONFIG is not read by it.
 SCHEDULER_CONFIG.update(
     {
         "apscheduler.jobstores.default": {
             "type": "sqlalchemy",
-            "url": f'postgresql://{get_env_variable("DATABASE_USER")}:'
-            f'{get_env_variable("DATABASE_PASSWORD")}@'
-            f'{get_env_variable("DATABASE_HOST")}:'
-            f'{get_env_variable("DATABASE_PORT")}/'
-            f'{get_env_variable("DATABASE_NAME")}',
+            "url": f"postgresql+psycopg://{DATABASE_USER}:{DATABASE_PASSWORD}@"
+            f"{DATABASE_HOST}:{DATABASE_PORT}/{DATABASE_NAME}",
         },
     }
 )
 
+# LangChain response cache persisted across processes
+LANGCHAIN_CONFIG["LLM_CACHE"] = get_env_variable("LANGCHAIN_LLM_CACHE", "sqlite")
+
 # Security settings
 SECURE_BROWSER_XSS_FILTER = True
 SECURE_CONTENT_TYPE_NOSNIFF = True
@@ -3,6 +3,7 @@ import time
 
 from django.contrib.auth.models import AnonymousUser
 from django.core.exceptions import PermissionDenied
+from django.db import connection
 from django.http import JsonResponse
 from django.utils.deprecation import MiddlewareMixin
 
@@ -39,15 +40,20 @@ class RequestLoggingMiddleware(MiddlewareMixin):
 
     def process_request(self, request):
         """Log incoming requests."""
-        request.start_time = time.time()
+        request.start_time = time.monotonic()
+        path = request.path
+        request._is_api = is_api = path[:5] == "/api/"
 
         # Log API requests
-        if request.path.startswith("/api/"):
+        if is_api and logger.isEnabledFor(logging.INFO):
+            method = request.method
             logger.info(
-                f"API Request: {request.method} {request.path}",
+                "API Request: %s %s",
+                method,
+                path,
                 extra={
-                    "method": request.method,
-                    "path": request.path,
+                    "method": method,
+                    "path": path,
                     "user": (
                         str(request.user) if hasattr(request, "user") else "Anonymous"
                     ),
@@ -57,30 +63,37 @@ class RequestLoggingMiddleware(MiddlewareMixin):
 
     def process_response(self, request, response):
         """Log response information."""
-        if hasattr(request, "start_time"):
-            duration = time.time() - request.start_time
-
-            # Log API responses
-            if request.path.startswith("/api/"):
-                logger.info(
-                    f"API Response: {response.status_code} in {duration:.3f}s",
-                    extra={
-                        "status_code": response.status_code,
-                        "duration": duration,
-                        "path": request.path,
-                        "method": request.method,
-                    },
-                )
+        # Log API responses
+        if getattr(request, "_is_api", False) and logger.isEnabledFor(logging.INFO):
+            duration = time.monotonic() - request.start_time
+            status_code = response.status_code
+            logger.info(
+                "API Response: %s in %.3fs",
+                status_code,
+                duration,
+                extra={
+                    "status_code": status_code,
+                    "duration": duration,
+                    "path": request.path,
+                    "method": request.method,
+                },
+            )
 
         return response
 
     def get_client_ip(self, request):
-        """Get the client's IP address."""
+        """Get the client's IP address, cached on the request."""
+        try:
+            return request._cached_client_ip
+        except AttributeError:
+            pass
+
         x_forwarded_for = request.META.get("HTTP_X_FORWARDED_FOR")
         if x_forwarded_for:
-            ip = x_forwarded_for.split(",")[0]
+            ip = x_forwarded_for.partition(",")[0].strip()
         else:
             ip = request.META.get("REMOTE_ADDR")
+        request._cached_client_ip = ip
         return ip
 
 
@@ -115,16 +128,24 @@ class ErrorHandlingMiddleware(MiddlewareMixin):
 class HealthCheckMiddleware(MiddlewareMixin):
     """Middleware for health check endpoints."""
 
+    # A successful database check is reused for this many seconds
+    db_check_interval = 1.0
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self._db_checked_at = float("-inf")
+
     def process_request(self, request):
         """Handle health check requests."""
         if request.path == "/health/":
             try:
-                from django.db import connection
-                from django.http import JsonResponse
-
                 # Check database connection
-                with connection.cursor() as cursor:
-                    cursor.execute("SELECT 1")
+                now = time.monotonic()
+                if now - self._db_checked_at >= self.db_check_interval:
+                    connection.ensure_connection()
+                    with connection.cursor() as cursor:
+                        cursor.execute("SELECT 1")
+                    self._db_checked_at = now
 
                 return JsonResponse(
                     {
@@ -141,3 +162,46 @@ class HealthCheckMiddleware(MiddlewareMixin):
                 )
 
         return None
+
+
+class ObservabilityMiddleware(MiddlewareMixin):
+    """Single middleware combining the security, logging and health checks.
+
+    Dispatches on the first path segment so requests outside ``/api/``,
+    ``/admin/`` and ``/health/`` return right away instead of going through
+    each middleware in turn.
+    """
+
+    def __init__(self, get_response):
+        super().__init__(get_response)
+        self.job_security = JobSecurityMiddleware(get_response)
+        self.request_logging = RequestLoggingMiddleware(get_response)
+        self.error_handling = ErrorHandlingMiddleware(get_response)
+        self.health_check = HealthCheckMiddleware(get_response)
+        self._request_handlers = {
+            "admin": self.job_security.process_request,
+            "api": self.request_logging.process_request,
+            "health": self.health_check.process_request,
+        }
+
+    @staticmethod
+    def _first_segment(path):
+        """Return the first segment of a path, e.g. ``api`` for ``/api/x/``."""
+        end = path.find("/", 1)
+        return path[1:end] if end != -1 else path[1:]
+
+    def process_request(self, request):
+        """Dispatch request to the handler registered for its path segment."""
+        handler = self._request_handlers.get(self._first_segment(request.path))
+        if handler is None:
+            return None
+        return handler(request)
+
+    def process_response(self, request, response):
+        """Log API responses."""
+        return self.request_logging.process_response(request, response)
+
+    def process_exception(self, request, exception):
+        """Log security exceptions and handle errors globally."""
+        self.job_security.process_exception(request, exception)
+        return self.error_handling.process_exception(request, exception)
@@ -1,13 +1,32 @@
+import os
+import time
 import uuid
 
 from django.db import models
 from django.utils import timezone
 
 
+def uuid7():
+    """Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The 48 most significant bits hold the Unix timestamp in milliseconds, so
+    new primary keys are appended to the end of the index instead of being
+    scattered across it like ``uuid4`` values.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+    value |= 0x7 << 76  # version
+    value |= (rand >> 68) << 64  # rand_a, 12 bits
+    value |= 0b10 << 62  # variant
+    value |= rand & 0x3FFF_FFFF_FFFF_FFFF  # rand_b, 62 bits
+    return uuid.UUID(int=value)
+
+
 class BaseModel(models.Model):
     """Base model with common fields."""
 
-    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     created_at = models.DateTimeField(default=timezone.now)
     updated_at = models.DateTimeField(auto_now=True)
     is_active = models.BooleanField(default=True)
@@ -30,6 +49,12 @@ class BaseRepository:
         except self.model.DoesNotExist:
             return None
 
+    def get_fields(self, obj_id, *fields):
+        """Get only the given fields of an object as a dict, or None."""
+        return (
+            self.model.objects.filter(id=obj_id, is_active=True).values(*fields).first()
+        )
+
     def get_all_active(self):
         """Get all active objects."""
         return self.model.objects.filter(is_active=True)
@@ -39,21 +64,26 @@ class BaseRepository:
         return self.model.objects.create(**kwargs)
 
     def update(self, obj_id, **kwargs):
-        """Update object."""
-        obj = self.get_by_id(obj_id)
-        if obj:
-            for key, value in kwargs.items():
-                setattr(obj, key, value)
-            obj.save()
-        return obj
+        """Update object with a single UPDATE query.
+
+        Uses ``QuerySet.update()``, so ``save()`` and model signals are not
+        triggered; ``updated_at`` is set explicitly.
+        """
+        kwargs.setdefault("updated_at", timezone.now())
+        updated = self.model.objects.filter(id=obj_id, is_active=True).update(**kwargs)
+        return self.get_by_id(obj_id) if updated else None
 
     def soft_delete(self, obj_id):
-        """Soft delete object."""
-        obj = self.get_by_id(obj_id)
-        if obj:
-            obj.is_active = False
-            obj.save()
-        return obj
+        """Soft delete object.
+
+        Returns True if an active object was deactivated. Like ``update``,
+        this bypasses ``save()`` and model signals.
+        """
+        return bool(
+            self.model.objects.filter(id=obj_id, is_active=True).update(
+                is_active=False, updated_at=timezone.now()
+            )
+        )
 
     def filter_by(self, **kwargs):
         """Filter objects by given criteria."""
@@ -0,0 +1,110 @@
+import json
+import logging
+from unittest import mock
+
+from django.contrib.auth.models import AnonymousUser
+from django.core.exceptions import PermissionDenied
+from django.http import HttpResponse
+from django.test import RequestFactory, SimpleTestCase, TestCase
+
+from core.middleware.security import ObservabilityMiddleware
+from core.utils.logging import StructuredLogger
+
+
+class StructuredLoggerTest(SimpleTestCase):
+    """Tests for StructuredLogger and its bound job loggers."""
+
+    def test_logger_is_plain_logger_without_context(self):
+        structured = StructuredLogger("tests.structured")
+
+        self.assertIsInstance(structured.logger, logging.Logger)
+
+    def test_log_job_start_sets_job_fields(self):
+        structured = StructuredLogger("tests.structured")
+
+        with self.assertLogs("tests.structured", level="INFO") as logs:
+            structured.log_job_start("job-1", "Job 1")
+
+        record = logs.records[0]
+        self.assertEqual(record.getMessage(), "Job job-1 started")
+        self.assertEqual(record.job_id, "job-1")
+        self.assertEqual(record.job_name, "Job 1")
+        self.assertEqual(record.status, "RUNNING")
+
+    def test_context_is_merged_into_job_events(self):
+        structured = StructuredLogger("tests.structured", source="nfe")
+
+        with self.assertLogs("tests.structured", level="ERROR") as logs:
+            structured.log_job_failure("job-1", "Job 1", "timeout")
+
+        record = logs.records[0]
+        self.assertEqual(record.source, "nfe")
+        self.assertEqual(record.status, "FAILED")
+        self.assertEqual(record.error, "timeout")
+
+    def test_bind_job_binds_job_fields_to_every_record(self):
+        structured = StructuredLogger("tests.structured", source="nfe")
+        job_logger = structured.bind_job("job-1", "Job 1")
+
+        with self.assertLogs("tests.structured", level="INFO") as logs:
+            job_logger.info("step %d", 1)
+            job_logger.info("step %d", 2, extra={"status": "RUNNING"})
+
+        for record in logs.records:
+            self.assertEqual(record.job_id, "job-1")
+            self.assertEqual(record.job_name, "Job 1")
+            self.assertEqual(record.source, "nfe")
+        self.assertEqual(logs.records[1].status, "RUNNING")
+
+
+class ObservabilityMiddlewareTest(TestCase):
+    """Tests for the path dispatch of ObservabilityMiddleware."""
+
+    def setUp(self):
+        self.factory = RequestFactory()
+        self.get_response = mock.Mock(return_value=HttpResponse("ok"))
+        self.middleware = ObservabilityMiddleware(self.get_response)
+
+    def _request(self, path):
+        request = self.factory.get(path)
+        request.user = AnonymousUser()
+        return request
+
+    def test_other_paths_go_straight_to_view(self):
+        request = self._request("/static/logo.png")
+
+        with self.assertNoLogs("core.middleware.security", "INFO"):
+            response = self.middleware(request)
+
+        self.get_response.assert_called_once_with(request)
+        self.assertEqual(response.content, b"ok")
+        self.assertFalse(hasattr(request, "start_time"))
+
+    def test_api_requests_are_logged(self):
+        request = self._request("/api/jobs/")
+
+        with self.assertLogs("core.middleware.security", "INFO") as logs:
+            response = self.middleware(request)
+
+        self.get_response.assert_called_once_with(request)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(logs.records[0].getMessage(), "API Request: GET /api/jobs/")
+        self.assertEqual(logs.records[1].status_code, 200)
+
+    def test_health_check_returns_json(self):
+        response = self.middleware(self._request("/health/"))
+
+        self.get_response.assert_not_called()
+        self.assertEqual(response.status_code, 200)
+        body = json.loads(response.content)
+        self.assertEqual(body["status"], "healthy")
+        self.assertEqual(body["services"]["database"], "ok")
+
+    def test_job_admin_requires_authentication(self):
+        request = self._request("/admin/jobs/")
+
+        with self.assertLogs("core.middleware.security", "WARNING"):
+            with self.assertRaises(PermissionDenied):
+                self.middleware.process_request(request)
+
+        self.get_response.assert_not_called()
@@ -1,41 +1,160 @@
-import json
+import copy
 import logging
+import queue
+import threading
+import time
+from datetime import datetime
+from datetime import timezone as dt_timezone
+from logging.handlers import QueueHandler
 from typing import Optional
 
-from django.db import transaction
+import orjson
+from django.db import connection, transaction
 
+logger = logging.getLogger(__name__)
 
-class DatabaseLogHandler(logging.Handler):
-    """Custom log handler for database logging."""
+
+class DatabaseLogHandler(QueueHandler):
+    """Custom log handler for database logging.
+
+    Records carrying a ``job_id`` are queued and written to the database in
+    batches by a background thread, so emitting never blocks on the database.
+    """
+
+    queue_size = 10_000
+    batch_size = 200
+    flush_interval = 0.5  # seconds
+
+    def __init__(self):
+        super().__init__(queue.Queue(maxsize=self.queue_size))
+        self.dropped_records = 0
+        self._stop_event = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._run, name="DatabaseLogHandler", daemon=True
+        )
+        self._flusher.start()
 
     def emit(self, record):
-        """Emit log record to database."""
+        """Queue log record for database persistence."""
+        if hasattr(record, "job_id"):
+            super().emit(record)
+
+    def prepare(self, record):
+        """Snapshot the plain message without applying the formatter."""
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        record.exc_text = None
+        return record
+
+    def enqueue(self, record):
+        """Queue record without blocking, dropping it if the queue is full."""
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped_records += 1
+
+    def close(self):
+        """Stop the flusher thread and persist any pending records."""
+        self._stop_event.set()
+        self._flusher.join(timeout=5)
+        batch = []
+        while True:
+            try:
+                batch.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        if batch:
+            self._flush(batch)
+        super().close()
+
+    def _run(self):
+        """Drain the queue in batches until the handler is closed."""
+        while not self._stop_event.is_set():
+            batch = self._next_batch()
+            if batch:
+                try:
+                    self._flush(batch)
+                finally:
+                    # Do not hold a (pooled) connection between batches
+                    connection.close()
+
+    def _next_batch(self):
+        """Collect up to ``batch_size`` records or wait ``flush_interval``."""
+        batch = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(self.queue.get(timeout=timeout))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, records):
+        """Write a batch of records to the database in one transaction.
+
+        Rows are inserted with a raw ``executemany`` so the batch skips model
+        instantiation; values are still prepared by each model field, which
+        keeps UUID, JSON and datetime encoding correct for every backend.
+        """
         try:
-            if hasattr(record, "job_id"):
-                with transaction.atomic():
-                    # Import here to avoid circular imports
-                    from apps.jobs.models import JobExecutionLog
-
-                    log_entry = JobExecutionLog(
-                        job_id=record.job_id,
-                        job_name=getattr(record, "job_name", ""),
-                        status=getattr(record, "status", "RUNNING"),
-                        error_message=(
-                            record.getMessage()
-                            if record.levelno >= logging.ERROR
-                            else None
-                        ),
-                        metadata={
-                            "level": record.levelname,
-                            "module": record.module,
-                            "funcName": record.funcName,
-                            "lineno": record.lineno,
-                        },
-                    )
-                    log_entry.save()
-        except Exception:
+            # Import here to avoid circular imports
+            from apps.jobs.models import JobExecutionLog
+            from core.models.base import uuid7
+
+            fields = JobExecutionLog._meta.concrete_fields
+            rows = []
+            for record in records:
+                created_at = datetime.fromtimestamp(record.created, tz=dt_timezone.utc)
+                values = {
+                    "id": uuid7(),
+                    "created_at": created_at,
+                    "updated_at": created_at,
+                    "is_active": True,
+                    "job_id": record.job_id,
+                    "job_name": getattr(record, "job_name", ""),
+                    "status": getattr(record, "status", "RUNNING"),
+                    "duration_seconds": None,
+                    "result": None,
+                    "error_message": (
+                        record.getMessage() if record.levelno >= logging.ERROR else None
+                    ),
+                    "metadata": {
+                        "level": record.levelname,
+                        "module": record.module,
+                        "funcName": record.funcName,
+                        "lineno": record.lineno,
+                    },
+                }
+                rows.append(
+                    [
+                        field.get_db_prep_save(
+                            values.get(field.attname, field.get_default()), connection
+                        )
+                        for field in fields
+                    ]
+                )
+
+            with transaction.atomic(), connection.cursor() as cursor:
+                cursor.executemany(self._insert_sql(JobExecutionLog, connection), rows)
+        except Exception as e:
             # Não deve quebrar a aplicação se logging falhar
-            pass
+            logger.error(f"Failed to write {len(records)} job log records: {str(e)}")
+
+    @staticmethod
+    def _insert_sql(model, connection):
+        """Build the INSERT statement for all concrete fields of ``model``."""
+        qn = connection.ops.quote_name
+        fields = model._meta.concrete_fields
+        return "INSERT INTO %s (%s) VALUES (%s)" % (
+            qn(model._meta.db_table),
+            ", ".join(qn(field.column) for field in fields),
+            ", ".join(["%s"] * len(fields)),
+        )
 
 
 class JobMetricsCollector:
@@ -61,12 +180,14 @@ class JobMetricsCollector:
                 error_message=error,
             )
         except Exception as e:
-            logger = logging.getLogger(__name__)
             logger.error(f"Failed to record job metrics: {str(e)}")
 
     @staticmethod
     def get_job_metrics(job_id: str, days: int = 30):
-        """Get job execution metrics for the last N days."""
+        """Get job execution metrics for the last N days.
+
+        Returns a list of ``(status, duration_seconds, created_at)`` tuples.
+        """
         try:
             from datetime import timedelta
 
@@ -74,27 +195,72 @@ class JobMetricsCollector:
             from django.utils import timezone
 
             since = timezone.now() - timedelta(days=days)
-            logs = JobExecutionLog.objects.filter(
-                job_id=job_id, created_at__gte=since
-            ).values("status", "duration_seconds", "created_at")
+            logs = (
+                JobExecutionLog.objects.filter(job_id=job_id, created_at__gte=since)
+                .values_list("status", "duration_seconds", "created_at")
+                .iterator(chunk_size=2000)
+            )
 
             return list(logs)
         except Exception as e:
-            logger = logging.getLogger(__name__)
             logger.error(f"Failed to get job metrics: {str(e)}")
             return []
 
+    @staticmethod
+    def get_job_summary(job_id: str, days: int = 30):
+        """Get aggregated job execution metrics for the last N days."""
+        try:
+            from datetime import timedelta
+
+            from apps.jobs.models import JobExecutionLog
+            from django.db.models import Avg, Count, Max
+            from django.utils import timezone
+
+            since = timezone.now() - timedelta(days=days)
+            return JobExecutionLog.objects.filter(
+                job_id=job_id, created_at__gte=since
+            ).aggregate(
+                executions=Count("id"),
+                avg_duration=Avg("duration_seconds"),
+                max_duration=Max("duration_seconds"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to get job summary: {str(e)}")
+            return {}
+
+
+class ContextLoggerAdapter(logging.LoggerAdapter):
+    """Logger adapter that merges bound context into per-call ``extra``."""
+
+    def process(self, msg, kwargs):
+        if not self.extra:
+            return msg, kwargs
+        extra = kwargs.get("extra")
+        kwargs["extra"] = {**self.extra, **extra} if extra else self.extra
+        return msg, kwargs
+
 
 class StructuredLogger:
     """Structured logging utility."""
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, **context):
         self.logger = logging.getLogger(name)
+        self.context = context
+        # Only pay for the adapter when there is context to merge
+        self._log = (
+            ContextLoggerAdapter(self.logger, context) if context else self.logger
+        )
+
+    def bind_job(self, job_id: str, job_name: str) -> ContextLoggerAdapter:
+        """Return a logger with the job context bound to every record."""
+        return ContextLoggerAdapter(
+            self.logger, {**self.context, "job_id": job_id, "job_name": job_name}
+        )
 
     def log_job_start(self, job_id: str, job_name: str, **kwargs):
         """Log job start event."""
         extra = {"job_id": job_id, "job_name": job_name, "status": "RUNNING"}
-        self.logger.info(f"Job {job_id} started", extra=extra, **kwargs)
+        self._log.info(f"Job {job_id} started", extra=extra, **kwargs)
 
     def log_job_success(self, job_id: str, job_name: str, duration: float, **kwargs):
         """Log job success event."""
@@ -104,7 +270,7 @@ class StructuredLogger:
             "status": "SUCCESS",
             "duration": duration,
         }
-        self.logger.info(
+        self._log.info(
             f"Job {job_id} completed successfully in {duration:.2f}s",
             extra=extra,
             **kwargs,
@@ -118,33 +284,33 @@ class StructuredLogger:
             "status": "FAILED",
             "error": error,
         }
-        self.logger.error(f"Job {job_id} failed: {error}", extra=extra, **kwargs)
+        self._log.error(f"Job {job_id} failed: {error}", extra=extra, **kwargs)
 
 
 class JSONFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    job_fields = ("job_id", "job_name", "status")
+
     def format(self, record):
+        rd = record.__dict__
         log_entry = {
-            "timestamp": self.formatTime(record),
-            "level": record.levelname,
-            "logger": record.name,
+            "timestamp": rd["created"],
+            "level": rd["levelname"],
+            "logger": rd["name"],
             "message": record.getMessage(),
-            "module": record.module,
-            "function": record.funcName,
-            "line": record.lineno,
+            "module": rd["module"],
+            "function": rd["funcName"],
+            "line": rd["lineno"],
         }
 
         # Add job-specific fields if present
-        if hasattr(record, "job_id"):
-            log_entry["job_id"] = record.job_id
-        if hasattr(record, "job_name"):
-            log_entry["job_name"] = record.job_name
-        if hasattr(record, "status"):
-            log_entry["status"] = record.status
+        for field in self.job_fields:
+            if field in rd:
+                log_entry[field] = rd[field]
 
         # Add exception info if present
-        if record.exc_info:
-            log_entry["exception"] = self.formatException(record.exc_info)
+        if rd["exc_info"]:
+            log_entry["exception"] = self.formatException(rd["exc_info"])
 
-        return json.dumps(log_entry)
+        return orjson.dumps(log_entry, default=str).decode()
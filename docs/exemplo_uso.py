@@ -18,36 +18,48 @@ django.setup()
 import logging
 
 from apps.jobs.schedulers import JobSchedulerService
-from apps.jobs.tasks import process_text_job, summarize_text_job
-from apps.langchain_integration.services.text_processor import (
-    TextProcessorService,
-    TextSummarizerService,
-)
 
 # Configurar logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# Textos de exemplo, com espaços já normalizados: o prompt fica menor e a
+# chave do cache de LLM é a mesma a cada execução
+TEXTO_EXEMPLO_PROCESSAMENTO = (
+    "O Django é um framework web Python de alto nível que encoraja o "
+    "desenvolvimento rápido e design limpo e pragmático. Construído por "
+    "desenvolvedores experientes, ele cuida de grande parte do aborrecimento do "
+    "desenvolvimento web, para que você possa se concentrar em escrever seu "
+    "aplicativo sem precisar reinventar a roda."
+)
+
+TEXTO_EXEMPLO_SUMARIZACAO = (
+    "O LangChain é uma estrutura para desenvolvimento de aplicações alimentadas "
+    "por modelos de linguagem. Ele permite que você conecte um LLM (Large "
+    "Language Model) a outras fontes de dados e permite que o LLM interaja com "
+    "seu ambiente. O LangChain fornece componentes modulares para construir "
+    "aplicações alimentadas por LLM, e também fornece chains pré-construídas que "
+    "combinam esses componentes para casos de uso específicos."
+)
+
+
 def exemplo_processamento_texto():
     """Exemplo de processamento de texto com LangChain."""
     logger.info("=== Exemplo: Processamento de Texto ===")
 
+    # Importado sob demanda: carrega LangChain/OpenAI apenas quando usado
+    from apps.langchain_integration.services.text_processor import (
+        TextProcessorService,
+    )
+
     # Inicializar service
     service = TextProcessorService(
         template="Analise o seguinte texto e extraia os pontos principais: {text}"
     )
 
-    # Texto de exemplo
-    texto = """
-    O Django é um framework web Python de alto nível que encoraja o desenvolvimento 
-    rápido e design limpo e pragmático. Construído por desenvolvedores experientes, 
-    ele cuida de grande parte do aborrecimento do desenvolvimento web, para que você 
-    possa se concentrar em escrever seu aplicativo sem precisar reinventar a roda.
-    """
-
     # Processar texto
-    resultado = service.process({"text": texto})
+    resultado = service.process({"text": TEXTO_EXEMPLO_PROCESSAMENTO})
 
     if resultado["success"]:
         logger.info(f"Texto processado com sucesso!")
@@ -60,21 +72,16 @@ def exemplo_sumarizacao():
     """Exemplo de sumarização de texto."""
     logger.info("=== Exemplo: Sumarização de Texto ===")
 
+    # Importado sob demanda: carrega LangChain/OpenAI apenas quando usado
+    from apps.langchain_integration.services.text_processor import (
+        TextSummarizerService,
+    )
+
     # Inicializar service
     service = TextSummarizerService(max_length=50)
 
-    # Texto de exemplo
-    texto = """
-    O LangChain é uma estrutura para desenvolvimento de aplicações alimentadas por 
-    modelos de linguagem. Ele permite que você conecte um LLM (Large Language Model) 
-    a outras fontes de dados e permite que o LLM interaja com seu ambiente. O 
-    LangChain fornece componentes modulares para construir aplicações alimentadas 
-    por LLM, e também fornece chains pré-construídas que combinam esses componentes 
-    para casos de uso específicos.
-    """
-
     # Sumarizar texto
-    resultado = service.process({"text": texto})
+    resultado = service.process({"text": TEXTO_EXEMPLO_SUMARIZACAO})
 
     if resultado["success"]:
         logger.info(f"Texto sumarizado com sucesso!")
@@ -91,34 +98,42 @@ def exemplo_job_agendado():
         # Iniciar o scheduler
         JobSchedulerService.start()
 
-        # Agendar job para processar texto a cada 5 minutos
-        JobSchedulerService.add_job(
-            func=lambda: process_text_job(
-                "Este é um texto de exemplo para processamento agendado.",
-                "Processe este texto: {text}",
-            ),
-            trigger="interval",
-            job_id="exemplo_processamento",
-            minutes=5,
-        )
-
-        # Agendar job para sumarizar texto diariamente
-        JobSchedulerService.add_job(
-            func=lambda: summarize_text_job(
-                "Este é um texto mais longo que precisa ser sumarizado regularmente...",
-                100,
-            ),
-            trigger="cron",
-            job_id="exemplo_sumarizacao",
-            hour=9,  # 9h da manhã
-            minute=0,
+        # Agendar os jobs de uma só vez (o scheduler acorda uma única vez)
+        # Referências textuais ("módulo:função") podem ser persistidas pelo job store
+        JobSchedulerService.add_jobs_bulk(
+            [
+                # Processar texto a cada 5 minutos
+                {
+                    "func": "apps.jobs.tasks:process_text_job",
+                    "trigger": "interval",
+                    "job_id": "exemplo_processamento",
+                    "args": (
+                        "Este é um texto de exemplo para processamento agendado.",
+                        "Processe este texto: {text}",
+                    ),
+                    "minutes": 5,
+                },
+                # Sumarizar texto diariamente
+                {
+                    "func": "apps.jobs.tasks:summarize_text_job",
+                    "trigger": "cron",
+                    "job_id": "exemplo_sumarizacao",
+                    "args": (
+                        "Este é um texto mais longo que precisa ser sumarizado regularmente...",
+                        100,
+                    ),
+                    "hour": 9,  # 9h da manhã
+                    "minute": 0,
+                },
+            ]
         )
 
-        # Listar jobs agendados
-        jobs = JobSchedulerService.list_jobs()
-        logger.info(f"Jobs agendados: {len(jobs)}")
-        for job in jobs:
-            logger.info(f"- {job.id}: próxima execução em {job.next_run_time}")
+        # Listar jobs agendados (uma única mensagem de log)
+        linhas = [
+            f"- {job.id}: próxima execução em {job.next_run_time}"
+            for job in JobSchedulerService.list_jobs()
+        ]
+        logger.info("Jobs agendados: %d\n%s", len(linhas), "\n".join(linhas))
 
     except Exception as e:
         logger.error(f"Erro ao agendar jobs: {str(e)}")
@@ -149,13 +164,14 @@ def exemplo_uso_completo():
         logger.error(f"❌ Erro na demonstração: {str(e)}")
 
     finally:
-        # Limpar jobs de exemplo
-        try:
-            JobSchedulerService.remove_job("exemplo_processamento")
-            JobSchedulerService.remove_job("exemplo_sumarizacao")
-            logger.info("🧹 Jobs de exemplo removidos")
-        except:
-            pass
+        # Limpar jobs de exemplo (jobs inexistentes são ignorados)
+        removidos = [
+            job_id
+            for job_id in ("exemplo_processamento", "exemplo_sumarizacao")
+            if JobSchedulerService.remove_job(job_id)
+        ]
+        if removidos:
+            logger.info(f"🧹 Jobs de exemplo removidos: {', '.join(removidos)}")
 
 
 if __name__ == "__main__":